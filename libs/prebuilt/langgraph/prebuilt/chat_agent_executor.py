@@ -1,6 +1,7 @@
 import inspect
 import warnings
 from collections.abc import Awaitable, Callable, Sequence
+from functools import lru_cache, partial, wraps
 from typing import (
     Annotated,
     Any,
@@ -28,9 +29,13 @@ from langchain_core.runnables import (
     RunnableConfig,
     RunnableSequence,
 )
+from langchain_core.runnables.config import run_in_executor
 from langchain_core.tools import BaseTool
+from langchain_core.utils.function_calling import convert_to_openai_tool
+from langgraph._internal._cache import default_cache_key
 from langgraph._internal._runnable import RunnableCallable, RunnableLike
 from langgraph._internal._typing import MISSING
+from langgraph.cache.base import BaseCache
 from langgraph.errors import ErrorCode, create_error_message
 from langgraph.graph import END, StateGraph
 from langgraph.graph.message import add_messages
@@ -38,7 +43,7 @@ from langgraph.graph.state import CompiledStateGraph
 from langgraph.managed import RemainingSteps
 from langgraph.runtime import Runtime
 from langgraph.store.base import BaseStore
-from langgraph.types import Checkpointer, Send
+from langgraph.types import CachePolicy, Checkpointer, Send
 from langgraph.typing import ContextT
 from langgraph.warnings import LangGraphDeprecatedSinceV10
 from pydantic import BaseModel
@@ -158,8 +163,11 @@ def _get_prompt_runnable(prompt: Prompt | None) -> Runnable:
             name=PROMPT_RUNNABLE_NAME,
         )
     elif callable(prompt):
+        # run sync prompts in a thread pool when invoked asynchronously,
+        # so that they don't block the event loop
         prompt_runnable = RunnableCallable(
             prompt,
+            wraps(prompt)(partial(run_in_executor, None, prompt)),  # type: ignore[call-arg]
             name=PROMPT_RUNNABLE_NAME,
         )
     elif isinstance(prompt, Runnable):
@@ -240,6 +248,83 @@ def _get_model(model: LanguageModelLike) -> BaseChatModel:
     return model
 
 
+@lru_cache(maxsize=256)
+def _get_call_model_input_schema(state_schema: type[Any]) -> type[Any]:
+    """Create a schema that inherits from state_schema and adds 'llm_input_messages'.
+
+    Cached per state schema, so that agents built from the same schema share the
+    same input schema, instead of creating (and re-analyzing) a new class every time.
+    """
+    if isinstance(state_schema, type) and issubclass(state_schema, BaseModel):
+        # For Pydantic schemas
+        from pydantic import create_model
+
+        return create_model(
+            "CallModelInputSchema",
+            llm_input_messages=(list[AnyMessage], ...),
+            __base__=state_schema,
+        )
+
+    # For TypedDict schemas
+    class CallModelInputSchema(state_schema):
+        llm_input_messages: list[AnyMessage]
+
+    return CallModelInputSchema
+
+
+# message fields that don't affect the model response and would prevent cache hits
+# (e.g. message IDs are randomly assigned by `add_messages`)
+_CACHE_KEY_EXCLUDED_MESSAGE_FIELDS = {"id", "response_metadata", "usage_metadata"}
+
+
+def _get_cache_fingerprint(obj: Any) -> Any:
+    """Get a stable, picklable representation of `obj` to use in cache keys."""
+    if obj is None or isinstance(obj, (str, int, float, bool)):
+        return obj
+    if isinstance(obj, BaseMessage):
+        return obj.model_dump(exclude=_CACHE_KEY_EXCLUDED_MESSAGE_FIELDS)
+    if isinstance(obj, (list, tuple)):
+        return tuple(_get_cache_fingerprint(o) for o in obj)
+    if isinstance(obj, dict):
+        return tuple(
+            sorted((str(k), _get_cache_fingerprint(v)) for k, v in obj.items())
+        )
+    # anything else can't be safely identified by its content, so only share
+    # cache entries for the same object within this process
+    return (type(obj).__qualname__, id(obj))
+
+
+def _get_model_cache_fingerprint(model: LanguageModelLike) -> Any:
+    """Get a stable representation of a static model and its bound kwargs."""
+    try:
+        chat_model = _get_model(model)
+    except TypeError:
+        return _get_cache_fingerprint(model)
+
+    steps = model.steps if isinstance(model, RunnableSequence) else [model]
+    bound_kwargs = next(
+        (step.kwargs for step in steps if isinstance(step, RunnableBinding)), {}
+    )
+    return chat_model._get_llm_string(**bound_kwargs)
+
+
+def _get_response_format_cache_fingerprint(
+    response_format: StructuredResponseSchema
+    | tuple[str, StructuredResponseSchema]
+    | None,
+) -> Any:
+    """Get a stable representation of the schema sent to the model for `response_format`."""
+    if isinstance(response_format, tuple):
+        prompt, schema = response_format
+        return (prompt, _get_response_format_cache_fingerprint(schema))
+    if response_format is None:
+        return None
+    try:
+        return _get_cache_fingerprint(convert_to_openai_tool(response_format))
+    except Exception:
+        return _get_cache_fingerprint(response_format)
+
+
 def _validate_chat_history(
     messages: Sequence[BaseMessage],
 ) -> None:
@@ -293,12 +378,13 @@ def create_react_agent(
     response_format: StructuredResponseSchema
     | tuple[str, StructuredResponseSchema]
     | None = None,
-    pre_model_hook: RunnableLike | None = None,
+    pre_model_hook: RunnableLike | Sequence[RunnableLike] | None = None,
     post_model_hook: RunnableLike | None = None,
     state_schema: StateSchemaType | None = None,
     context_schema: type[Any] | None = None,
     checkpointer: Checkpointer | None = None,
     store: BaseStore | None = None,
+    cache: BaseCache | None = None,
     interrupt_before: list[str] | None = None,
     interrupt_after: list[str] | None = None,
     debug: bool = False,
@@ -416,6 +502,10 @@ def create_react_agent(
                     ...
                 }
                 ```
+
+            A sequence of hooks can also be provided. The hooks are run in parallel
+            (in the same step) before the `agent` node, so they must update disjoint state keys.
+            A sequence with a single hook is equivalent to passing the hook directly.
         post_model_hook: An optional node to add after the `agent` node (i.e., the node that calls the LLM).
             Useful for implementing human-in-the-loop, guardrails, validation, or other post-processing.
             Post-model hook must be a callable or a runnable that takes in current graph state and returns a state update.
@@ -438,6 +528,17 @@ def create_react_agent(
             the state of the graph (e.g., as chat memory) for a single thread (e.g., a single conversation).
         store: An optional store object. This is used for persisting data
             across multiple threads (e.g., multiple conversations / users).
+        cache: An optional cache object. If provided, LLM responses are cached
+            and reused when the agent is called again with identical input messages,
+            skipping the model call entirely.
+
+            !!! Note
+                Cache entries are keyed on the content of the messages passed to the model
+                (ignoring message IDs), the model and its bound parameters, the `prompt`,
+                the `response_format` schema and `name`.
+                Since the model input must be known from the state alone, `cache` can't be used
+                with dynamic models or with callable / `Runnable` prompts (which may depend on
+                other state keys, config or the store).
         interrupt_before: An optional list of node names to interrupt before.
             Should be one of the following: `"agent"`, `"tools"`.
 
@@ -550,15 +651,39 @@ def create_react_agent(
         tool_classes = list(tools.tools_by_name.values())
         tool_node = tools
     else:
-        llm_builtin_tools = [t for t in tools if isinstance(t, dict)]
-        tool_node = ToolNode([t for t in tools if not isinstance(t, dict)])
+        # split provider built-in tools from regular tools in a single pass
+        regular_tools: list[BaseTool | Callable] = []
+        for t in tools:
+            if isinstance(t, dict):
+                llm_builtin_tools.append(t)
+            else:
+                regular_tools.append(t)
+        tool_node = ToolNode(regular_tools)
         tool_classes = list(tool_node.tools_by_name.values())
 
+    is_pydantic_state = isinstance(state_schema, type) and issubclass(
+        state_schema, BaseModel
+    )
     is_dynamic_model = not isinstance(model, (str, Runnable)) and callable(model)
     is_async_dynamic_model = is_dynamic_model and inspect.iscoroutinefunction(model)
 
+    if cache is not None:
+        # cache keys are built from what is sent to the model, which can't be
+        # determined up front when it depends on the state, config or store
+        if is_dynamic_model:
+            raise ValueError("`cache` is not supported with dynamic models.")
+        if prompt is not None and not isinstance(prompt, (str, SystemMessage)):
+            raise ValueError(
+                "`cache` is only supported with a static `prompt` (`str` or `SystemMessage`), "
+                f"got {type(prompt)}."
+            )
+
     tool_calling_enabled = len(tool_classes) > 0
 
+    # build the prompt runnable (and its system message) once,
+    # so that dynamic models don't rebuild it on every call
+    prompt_runnable = _get_prompt_runnable(prompt)
+
     if not is_dynamic_model:
         if isinstance(model, str):
             try:
@@ -573,29 +698,35 @@ def create_react_agent(
 
             model = cast(BaseChatModel, init_chat_model(model))
 
+        # only copy the tool list when there are provider built-in tools to add
+        bindable_tools: Sequence[BaseTool | dict[str, Any]] = (
+            [*tool_classes, *llm_builtin_tools] if llm_builtin_tools else tool_classes
+        )
         if (
-            _should_bind_tools(model, tool_classes, num_builtin=len(llm_builtin_tools))  # type: ignore[arg-type]
-            and len(tool_classes + llm_builtin_tools) > 0
-        ):
-            model = cast(BaseChatModel, model).bind_tools(
-                tool_classes + llm_builtin_tools  # type: ignore[operator]
+            _should_bind_tools(
+                model,  # type: ignore[arg-type]
+                tool_classes,
+                num_builtin=len(llm_builtin_tools),
             )
+            and bindable_tools
+        ):
+            model = cast(BaseChatModel, model).bind_tools(bindable_tools)
 
-        static_model: Runnable | None = _get_prompt_runnable(prompt) | model  # type: ignore[operator]
+        static_model: Runnable | None = prompt_runnable | model  # type: ignore[operator]
     else:
         # For dynamic models, we'll create the runnable at runtime
         static_model = None
 
     # If any of the tools are configured to return_directly after running,
     # our graph needs to check if these were called
-    should_return_direct = {t.name for t in tool_classes if t.return_direct}
+    should_return_direct = frozenset(t.name for t in tool_classes if t.return_direct)
 
     def _resolve_model(
         state: StateSchema, runtime: Runtime[ContextT]
     ) -> LanguageModelLike:
         """Resolve the model to use, handling both static and dynamic models."""
         if is_dynamic_model:
-            return _get_prompt_runnable(prompt) | model(state, runtime)  # type: ignore[operator]
+            return prompt_runnable | model(state, runtime)  # type: ignore[operator]
         else:
             return static_model
 
@@ -605,46 +736,79 @@ def create_react_agent(
         """Async resolve the model to use, handling both static and dynamic models."""
         if is_async_dynamic_model:
             resolved_model = await model(state, runtime)  # type: ignore[misc,operator]
-            return _get_prompt_runnable(prompt) | resolved_model
+            return prompt_runnable | resolved_model
         elif is_dynamic_model:
-            return _get_prompt_runnable(prompt) | model(state, runtime)  # type: ignore[operator]
+            return prompt_runnable | model(state, runtime)  # type: ignore[operator]
         else:
             return static_model
 
     def _are_more_steps_needed(state: StateSchema, response: BaseMessage) -> bool:
-        has_tool_calls = isinstance(response, AIMessage) and response.tool_calls
-        all_tools_return_direct = (
-            all(call["name"] in should_return_direct for call in response.tool_calls)
-            if isinstance(response, AIMessage)
-            else False
-        )
         remaining_steps = _get_state_value(state, "remaining_steps", None)
-        if remaining_steps is not None:
-            if remaining_steps < 1 and all_tools_return_direct:
-                return True
-            elif remaining_steps < 2 and has_tool_calls:
-                return True
+        # only inspect the tool calls when we're about to run out of steps
+        if (
+            remaining_steps is None
+            or remaining_steps >= 2
+            or not isinstance(response, AIMessage)
+        ):
+            return False
+
+        if remaining_steps < 1 and all(
+            call["name"] in should_return_direct for call in response.tool_calls
+        ):
+            return True
+
+        return bool(response.tool_calls)
+
+    model_cache_policy: CachePolicy | None = None
+    if cache is not None:
+        # all agents share the same node identifiers, so namespace the cache
+        # entries by everything that determines the model response at build time
+        agent_fingerprint = (
+            name,
+            _get_model_cache_fingerprint(model),  # type: ignore[arg-type]
+            _get_cache_fingerprint(prompt),
+            _get_response_format_cache_fingerprint(response_format),
+        )
+
+        def _get_model_cache_key(state: StateSchema) -> str | bytes:
+            messages = (
+                _get_state_value(state, "llm_input_messages")
+                if pre_model_hook is not None
+                else None
+            ) or _get_state_value(state, "messages")
+            # the model response only depends on `remaining_steps` via
+            # `_are_more_steps_needed`, so collapse it to avoid needless misses
+            remaining_steps = _get_state_value(state, "remaining_steps", None)
+            if remaining_steps is not None:
+                remaining_steps = min(remaining_steps, 2)
+            return default_cache_key(
+                agent_fingerprint, _get_cache_fingerprint(messages), remaining_steps
+            )
 
-        return False
+        model_cache_policy = CachePolicy(key_func=_get_model_cache_key)
 
     def _get_model_input_state(state: StateSchema) -> StateSchema:
         if pre_model_hook is not None:
             messages = (
                 _get_state_value(state, "llm_input_messages")
             ) or _get_state_value(state, "messages")
-            error_msg = f"Expected input to call_model to have 'llm_input_messages' or 'messages' key, but got {state}"
         else:
             messages = _get_state_value(state, "messages")
-            error_msg = (
-                f"Expected input to call_model to have 'messages' key, but got {state}"
-            )
 
         if messages is None:
-            raise ValueError(error_msg)
+            # only format the (potentially large) state when raising
+            expected_keys = (
+                "'llm_input_messages' or 'messages' key"
+                if pre_model_hook is not None
+                else "'messages' key"
+            )
+            raise ValueError(
+                f"Expected input to call_model to have {expected_keys}, but got {state}"
+            )
 
         _validate_chat_history(messages)
         # we're passing messages under `messages` key, as this is expected by the prompt
-        if isinstance(state_schema, type) and issubclass(state_schema, BaseModel):
+        if is_pydantic_state:
             state.messages = messages  # type: ignore
         else:
             state["messages"] = messages  # type: ignore
@@ -716,25 +880,16 @@ def create_react_agent(
 
     input_schema: StateSchemaType
     if pre_model_hook is not None:
-        # Dynamically create a schema that inherits from state_schema and adds 'llm_input_messages'
-        if isinstance(state_schema, type) and issubclass(state_schema, BaseModel):
-            # For Pydantic schemas
-            from pydantic import create_model
-
-            input_schema = create_model(
-                "CallModelInputSchema",
-                llm_input_messages=(list[AnyMessage], ...),
-                __base__=state_schema,
-            )
-        else:
-            # For TypedDict schemas
-            class CallModelInputSchema(state_schema):  # type: ignore
-                llm_input_messages: list[AnyMessage]
-
-            input_schema = CallModelInputSchema
+        input_schema = _get_call_model_input_schema(state_schema)  # type: ignore[arg-type]
     else:
         input_schema = state_schema
 
+    structured_response_schema = response_format
+    structured_response_system_message: SystemMessage | None = None
+    if isinstance(response_format, tuple):
+        system_prompt, structured_response_schema = response_format
+        structured_response_system_message = SystemMessage(content=system_prompt)
+
     def generate_structured_response(
         state: StateSchema, runtime: Runtime[ContextT], config: RunnableConfig
     ) -> StateSchema:
@@ -746,10 +901,8 @@ def create_react_agent(
             raise RuntimeError(msg)
 
         messages = _get_state_value(state, "messages")
-        structured_response_schema = response_format
-        if isinstance(response_format, tuple):
-            system_prompt, structured_response_schema = response_format
-            messages = [SystemMessage(content=system_prompt)] + list(messages)
+        if structured_response_system_message is not None:
+            messages = [structured_response_system_message, *messages]
 
         resolved_model = _resolve_model(state, runtime)
         model_with_structured_output = _get_model(
@@ -764,10 +917,8 @@ def create_react_agent(
         state: StateSchema, runtime: Runtime[ContextT], config: RunnableConfig
     ) -> StateSchema:
         messages = _get_state_value(state, "messages")
-        structured_response_schema = response_format
-        if isinstance(response_format, tuple):
-            system_prompt, structured_response_schema = response_format
-            messages = [SystemMessage(content=system_prompt)] + list(messages)
+        if structured_response_system_message is not None:
+            messages = [structured_response_system_message, *messages]
 
         resolved_model = await _aresolve_model(state, runtime)
         model_with_structured_output = _get_model(
@@ -778,6 +929,43 @@ def create_react_agent(
         response = await model_with_structured_output.ainvoke(messages, config)
         return {"structured_response": response}
 
+    def _add_pre_model_hook(workflow: StateGraph) -> str:
+        """Add the pre-model hook node(s) to the graph and return the entrypoint."""
+        if pre_model_hook is None:
+            return "agent"
+
+        hooks = (
+            list(pre_model_hook)
+            if isinstance(pre_model_hook, Sequence)
+            else [pre_model_hook]
+        )
+        if not hooks:
+            raise ValueError("`pre_model_hook` must not be an empty sequence")
+
+        if len(hooks) == 1:
+            # a single hook runs directly before the "agent" node,
+            # without the extra fan-out step
+            workflow.add_node("pre_model_hook", hooks[0])  # type: ignore[arg-type]
+            workflow.add_edge("pre_model_hook", "agent")
+        else:
+            # fan out from a no-op node so that independent hooks run in the same
+            # step, the "agent" node then waits for all of them to finish
+            workflow.add_node(
+                "pre_model_hook",
+                RunnableCallable(
+                    lambda state: None, name="pre_model_hook", trace=False
+                ),
+            )
+            hook_names = []
+            for i, hook in enumerate(hooks):
+                hook_name = f"pre_model_hook_{i}"
+                workflow.add_node(hook_name, hook)  # type: ignore[arg-type]
+                workflow.add_edge("pre_model_hook", hook_name)
+                hook_names.append(hook_name)
+            workflow.add_edge(hook_names, "agent")
+
+        return "pre_model_hook"
+
     if not tool_calling_enabled:
         # Define a new graph
         workflow = StateGraph(state_schema=state_schema, context_schema=context_schema)
@@ -785,14 +973,9 @@ def create_react_agent(
             "agent",
             RunnableCallable(call_model, acall_model),
             input_schema=input_schema,
+            cache_policy=model_cache_policy,
         )
-        if pre_model_hook is not None:
-            workflow.add_node("pre_model_hook", pre_model_hook)  # type: ignore[arg-type]
-            workflow.add_edge("pre_model_hook", "agent")
-            entrypoint = "pre_model_hook"
-        else:
-            entrypoint = "agent"
-
+        entrypoint = _add_pre_model_hook(workflow)
         workflow.set_entry_point(entrypoint)
 
         if post_model_hook is not None:
@@ -806,6 +989,7 @@ def create_react_agent(
                     generate_structured_response,
                     agenerate_structured_response,
                 ),
+                cache_policy=model_cache_policy,
             )
             if post_model_hook is not None:
                 workflow.add_edge("post_model_hook", "generate_structured_response")
@@ -815,31 +999,39 @@ def create_react_agent(
         return workflow.compile(
             checkpointer=checkpointer,
             store=store,
+            cache=cache,
             interrupt_before=interrupt_before,
             interrupt_after=interrupt_after,
             debug=debug,
             name=name,
         )
 
+    # Resolve the static routing destinations once, at build time
+    finish_destination = (
+        "generate_structured_response" if response_format is not None else END
+    )
+    no_tool_calls_destination: str
+    tool_calls_destination: str | None
+    if post_model_hook is not None:
+        no_tool_calls_destination = "post_model_hook"
+        tool_calls_destination = "tools" if version == "v1" else "post_model_hook"
+    else:
+        no_tool_calls_destination = finish_destination
+        tool_calls_destination = "tools" if version == "v1" else None
+
     # Define the function that determines whether to continue or not
     def should_continue(state: StateSchema) -> str | list[Send]:
         messages = _get_state_value(state, "messages")
         last_message = messages[-1]
         # If there is no function call, then we finish
         if not isinstance(last_message, AIMessage) or not last_message.tool_calls:
-            if post_model_hook is not None:
-                return "post_model_hook"
-            elif response_format is not None:
-                return "generate_structured_response"
-            else:
-                return END
+            return no_tool_calls_destination
         # Otherwise if there is, we continue
         else:
-            if version == "v1":
-                return "tools"
-            elif version == "v2":
-                if post_model_hook is not None:
-                    return "post_model_hook"
+            if tool_calls_destination is not None:
+                return tool_calls_destination
+            else:
+                # distribute the tool calls across multiple instances of the tool node
                 return [
                     Send(
                         "tools",
@@ -862,17 +1054,13 @@ def create_react_agent(
         "agent",
         RunnableCallable(call_model, acall_model),
         input_schema=input_schema,
+        cache_policy=model_cache_policy,
     )
     workflow.add_node("tools", tool_node)
 
     # Optionally add a pre-model hook node that will be called
     # every time before the "agent" (LLM-calling node)
-    if pre_model_hook is not None:
-        workflow.add_node("pre_model_hook", pre_model_hook)  # type: ignore[arg-type]
-        workflow.add_edge("pre_model_hook", "agent")
-        entrypoint = "pre_model_hook"
-    else:
-        entrypoint = "agent"
+    entrypoint = _add_pre_model_hook(workflow)
 
     # Set the entrypoint as `agent`
     # This means that this node is the first one called
@@ -897,6 +1085,7 @@ def create_react_agent(
                 generate_structured_response,
                 agenerate_structured_response,
             ),
+            cache_policy=model_cache_policy,
         )
         if post_model_hook is not None:
             post_model_hook_paths.append("generate_structured_response")
@@ -920,14 +1109,18 @@ def create_react_agent(
             """
 
             messages = _get_state_value(state, "messages")
-            tool_messages = [
+            # collect the IDs of all tool calls that already have results in a set,
+            # so checking the pending tool calls doesn't rescan the history
+            tool_call_ids_with_results = {
                 m.tool_call_id for m in messages if isinstance(m, ToolMessage)
-            ]
+            }
             last_ai_message = next(
                 m for m in reversed(messages) if isinstance(m, AIMessage)
             )
             pending_tool_calls = [
-                c for c in last_ai_message.tool_calls if c["id"] not in tool_messages
+                c
+                for c in last_ai_message.tool_calls
+                if c["id"] not in tool_call_ids_with_results
             ]
 
             if pending_tool_calls:
@@ -944,10 +1137,8 @@ def create_react_agent(
                 ]
             elif isinstance(messages[-1], ToolMessage):
                 return entrypoint
-            elif response_format is not None:
-                return "generate_structured_response"
             else:
-                return END
+                return finish_destination
 
         workflow.add_conditional_edges(
             "post_model_hook",
@@ -989,6 +1180,7 @@ def create_react_agent(
     return workflow.compile(
         checkpointer=checkpointer,
         store=store,
+        cache=cache,
         interrupt_before=interrupt_before,
         interrupt_after=interrupt_after,
         debug=debug,
@@ -125,7 +125,7 @@ class _ToolCallRequestOverrides(TypedDict, total=False):
     state: Any
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolCallRequest:
     """Tool execution request passed to tool call interceptors.
 
@@ -559,7 +559,7 @@ def _filter_validation_errors(
     return filtered_errors
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class _InjectedArgs:
     """Internal structure for tracking injected arguments for a tool.
 
@@ -767,6 +767,7 @@ class ToolNode(RunnableCallable):
         self._tools_by_name: dict[str, BaseTool] = {}
         self._injected_args: dict[str, _InjectedArgs] = {}
         self._handle_tool_errors = handle_tool_errors
+        self._handled_types: tuple[type[Exception], ...] | None = None
         self._messages_key = messages_key
         self._wrap_tool_call = wrap_tool_call
         self._awrap_tool_call = awrap_tool_call
@@ -784,6 +785,33 @@ class ToolNode(RunnableCallable):
         """Mapping from tool name to BaseTool instance."""
         return self._tools_by_name
 
+    def _get_handled_types(self) -> tuple[type[Exception], ...]:
+        """Get the exception types handled by `handle_tool_errors`.
+
+        Computed on first use and cached, since inferring the types from a custom
+        error handler requires inspecting its signature and type hints.
+        """
+        if self._handled_types is not None:
+            return self._handled_types
+
+        handled_types: tuple[type[Exception], ...]
+        if isinstance(self._handle_tool_errors, type) and issubclass(
+            self._handle_tool_errors, Exception
+        ):
+            handled_types = (self._handle_tool_errors,)
+        elif isinstance(self._handle_tool_errors, tuple):
+            handled_types = self._handle_tool_errors
+        elif callable(self._handle_tool_errors) and not isinstance(
+            self._handle_tool_errors, type
+        ):
+            handled_types = _infer_handled_types(self._handle_tool_errors)
+        else:
+            # default behavior is catching all exceptions
+            handled_types = (Exception,)
+
+        self._handled_types = handled_types
+        return handled_types
+
     def _func(
         self,
         input: list[AnyMessage] | dict[str, Any] | BaseModel,
@@ -950,20 +978,7 @@ class ToolNode(RunnableCallable):
             raise
         except Exception as e:
             # Determine which exception types are handled
-            handled_types: tuple[type[Exception], ...]
-            if isinstance(self._handle_tool_errors, type) and issubclass(
-                self._handle_tool_errors, Exception
-            ):
-                handled_types = (self._handle_tool_errors,)
-            elif isinstance(self._handle_tool_errors, tuple):
-                handled_types = self._handle_tool_errors
-            elif callable(self._handle_tool_errors) and not isinstance(
-                self._handle_tool_errors, type
-            ):
-                handled_types = _infer_handled_types(self._handle_tool_errors)
-            else:
-                # default behavior is catching all exceptions
-                handled_types = (Exception,)
+            handled_types = self._get_handled_types()
 
             # Check if this error should be handled
             if not self._handle_tool_errors or not isinstance(e, handled_types):
@@ -1103,20 +1118,7 @@ class ToolNode(RunnableCallable):
             raise
         except Exception as e:
             # Determine which exception types are handled
-            handled_types: tuple[type[Exception], ...]
-            if isinstance(self._handle_tool_errors, type) and issubclass(
-                self._handle_tool_errors, Exception
-            ):
-                handled_types = (self._handle_tool_errors,)
-            elif isinstance(self._handle_tool_errors, tuple):
-                handled_types = self._handle_tool_errors
-            elif callable(self._handle_tool_errors) and not isinstance(
-                self._handle_tool_errors, type
-            ):
-                handled_types = _infer_handled_types(self._handle_tool_errors)
-            else:
-                # default behavior is catching all exceptions
-                handled_types = (Exception,)
+            handled_types = self._get_handled_types()
 
             # Check if this error should be handled
             if not self._handle_tool_errors or not isinstance(e, handled_types):
@@ -2,6 +2,7 @@ import dataclasses
 import inspect
 import json
 import sys
+import threading
 from functools import partial
 from typing import (
     Annotated,
@@ -25,6 +26,7 @@ from langchain_core.messages import (
 from langchain_core.runnables import RunnableConfig, RunnableLambda
 from langchain_core.tools import InjectedToolCallId, ToolException
 from langchain_core.tools import tool as dec_tool
+from langgraph.cache.memory import InMemoryCache
 from langgraph.checkpoint.base import BaseCheckpointSaver
 from langgraph.config import get_stream_writer
 from langgraph.graph import START, MessagesState, StateGraph, add_messages
@@ -191,6 +193,24 @@ async def test_callable_prompt_async():
     assert response == expected_response
 
 
+async def test_callable_prompt_sync_in_async_agent():
+    main_thread = threading.get_ident()
+    prompt_threads = []
+
+    def prompt(state):
+        prompt_threads.append(threading.get_ident())
+        modified_message = f"Bar {state['messages'][-1].content}"
+        return [HumanMessage(content=modified_message)]
+
+    agent = create_react_agent(FakeToolCallingModel(), [], prompt=prompt)
+    inputs = [HumanMessage("hi?")]
+    response = await agent.ainvoke({"messages": inputs})
+    expected_response = {"messages": inputs + [AIMessage(content="Bar hi?", id="0")]}
+    assert response == expected_response
+    # sync prompt should be offloaded from the event loop thread
+    assert prompt_threads and prompt_threads[0] != main_thread
+
+
 def test_runnable_prompt():
     prompt = RunnableLambda(
         lambda state: [HumanMessage(content=f"Baz {state['messages'][-1].content}")]
@@ -530,6 +550,102 @@ class CustomStatePydantic(AgentStatePydantic):
     user_name: str | None = None
 
 
+def test_react_agent_with_cache() -> None:
+    model = FakeToolCallingModel()
+    cache = InMemoryCache()
+    agent = create_react_agent(model, [], cache=cache)
+    first = agent.invoke({"messages": [HumanMessage("hi?")]})
+    assert model.index == 1
+
+    # new messages with identical content are served from the cache,
+    # regardless of their (randomly assigned) IDs
+    second = agent.invoke({"messages": [HumanMessage("hi?")]})
+    assert second["messages"][-1] == first["messages"][-1]
+    agent.invoke({"messages": [{"role": "user", "content": "hi?"}]})
+    assert model.index == 1
+
+    # different input messages call the model again
+    agent.invoke({"messages": [HumanMessage("bye?")]})
+    assert model.index == 2
+
+    # agents with a different prompt don't share cache entries
+    prompt_model = FakeToolCallingModel()
+    prompt_agent = create_react_agent(
+        prompt_model, [], prompt="You are a pirate", cache=cache
+    )
+    result = prompt_agent.invoke({"messages": [HumanMessage("hi?")]})
+    assert result["messages"][-1].content == "You are a pirate-hi?"
+    assert prompt_model.index == 1
+
+    # nor do agents with different model parameters
+    other_model = FakeToolCallingModel()
+    other_agent = create_react_agent(other_model.bind(stop=["bye"]), [], cache=cache)
+    other_agent.invoke({"messages": [HumanMessage("hi?")]})
+    assert other_model.index == 1
+
+
+def test_react_agent_with_cache_prompt_factory() -> None:
+    cache = InMemoryCache()
+
+    def make_agent(persona: str):
+        model = FakeToolCallingModel()
+        return model, create_react_agent(
+            model, [], prompt=SystemMessage(persona), cache=cache
+        )
+
+    pirate_model, pirate = make_agent("pirate")
+    lawyer_model, lawyer = make_agent("lawyer")
+    pirate_result = pirate.invoke({"messages": [HumanMessage("hi")]})
+    lawyer_result = lawyer.invoke({"messages": [HumanMessage("hi")]})
+    assert pirate_result["messages"][-1].content == "pirate-hi"
+    assert lawyer_result["messages"][-1].content == "lawyer-hi"
+    assert pirate_model.index == 1
+    assert lawyer_model.index == 1
+
+
+def test_react_agent_with_cache_unsupported_prompt() -> None:
+    class UserState(AgentState):
+        user_name: str
+
+    # prompts that depend on other state keys, config or the store can't be
+    # captured by the cache key, so they must not be cached
+    def state_prompt(state):
+        return [SystemMessage(f"user is {state['user_name']}")] + state["messages"]
+
+    def make_prompt(persona: str):
+        return lambda state: [SystemMessage(persona)] + state["messages"]
+
+    for prompt in (
+        state_prompt,
+        make_prompt("pirate"),
+        make_prompt("lawyer"),
+        RunnableLambda(state_prompt),
+    ):
+        with pytest.raises(ValueError, match="static `prompt`"):
+            create_react_agent(
+                FakeToolCallingModel(),
+                [],
+                prompt=prompt,
+                state_schema=UserState,
+                cache=InMemoryCache(),
+            )
+
+    def dynamic_model(state, runtime):
+        return FakeToolCallingModel()
+
+    with pytest.raises(ValueError, match="dynamic models"):
+        create_react_agent(dynamic_model, [], cache=InMemoryCache())
+
+
+async def test_react_agent_with_cache_async() -> None:
+    model = FakeToolCallingModel()
+    agent = create_react_agent(model, [], cache=InMemoryCache())
+    first = await agent.ainvoke({"messages": [HumanMessage("hi?")]})
+    second = await agent.ainvoke({"messages": [HumanMessage("hi?")]})
+    assert second["messages"][-1] == first["messages"][-1]
+    assert model.index == 1
+
+
 @pytest.mark.parametrize("version", REACT_TOOL_CALL_VERSIONS)
 @pytest.mark.parametrize("state_schema", [CustomState, CustomStatePydantic])
 def test_react_agent_update_state(
@@ -1954,6 +2070,82 @@ def test_pre_model_hook() -> None:
     }
 
 
+@pytest.mark.parametrize("state_schema", [AgentState, AgentStatePydantic])
+def test_pre_model_hook_input_schema_reused(state_schema: StateSchemaType) -> None:
+    def pre_model_hook(state):
+        return {"llm_input_messages": [HumanMessage("Hello!")]}
+
+    agents = [
+        create_react_agent(
+            FakeToolCallingModel(),
+            [],
+            pre_model_hook=pre_model_hook,
+            state_schema=state_schema,
+        )
+        for _ in range(2)
+    ]
+    input_schemas = [agent.builder.nodes["agent"].input_schema for agent in agents]
+    assert input_schemas[0] is input_schemas[1]
+    assert input_schemas[0] is not state_schema
+
+    result = agents[1].invoke({"messages": [HumanMessage("hi?")]})
+    assert result["messages"][-1].content == "Hello!"
+
+
+def test_pre_model_hook_parallel() -> None:
+    class HookState(AgentState):
+        foo: str
+        bar: str
+
+    model = FakeToolCallingModel(tool_calls=[])
+
+    def foo_hook(state: HookState):
+        return {"foo": "foo"}
+
+    def bar_hook(state: HookState):
+        return {"llm_input_messages": [HumanMessage("Hello!")], "bar": "bar"}
+
+    agent = create_react_agent(
+        model, [], pre_model_hook=[foo_hook, bar_hook], state_schema=HookState
+    )
+    assert {"pre_model_hook", "pre_model_hook_0", "pre_model_hook_1"} <= set(
+        agent.nodes
+    )
+    result = agent.invoke({"messages": [HumanMessage("hi?")]})
+    assert result == {
+        "messages": [
+            _AnyIdHumanMessage(content="hi?"),
+            AIMessage(content="Hello!", id="0"),
+        ],
+        "foo": "foo",
+        "bar": "bar",
+    }
+
+    # both hooks run in the same step, before the agent node
+    updates = [
+        next(iter(chunk))
+        for chunk in agent.stream(
+            {"messages": [HumanMessage("hi?")]}, stream_mode="updates"
+        )
+    ]
+    assert set(updates[-3:-1]) == {"pre_model_hook_0", "pre_model_hook_1"}
+    assert updates[-1] == "agent"
+
+    # a single hook in a sequence is added directly, without the fan-out step
+    agent = create_react_agent(
+        model, [], pre_model_hook=[bar_hook], state_schema=HookState
+    )
+    assert "pre_model_hook" in agent.nodes
+    assert "pre_model_hook_0" not in agent.nodes
+    updates = [
+        next(iter(chunk))
+        for chunk in agent.stream(
+            {"messages": [HumanMessage("hi?")]}, stream_mode="updates"
+        )
+    ]
+    assert updates == ["pre_model_hook", "agent"]
+
+
 def test_post_model_hook() -> None:
     class FlagState(AgentState):
         flag: bool
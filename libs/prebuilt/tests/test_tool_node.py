@@ -9,7 +9,7 @@ from typing import (
     NoReturn,
     TypeVar,
 )
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import pytest
 from langchain_core.messages import (
@@ -43,6 +43,7 @@ from langgraph.prebuilt.tool_node import (
     TOOL_CALL_ERROR_TEMPLATE,
     ToolInvocationError,
     ToolRuntime,
+    _infer_handled_types,
     tools_condition,
 )
 
@@ -463,6 +464,31 @@ async def test_tool_node_error_handling_callable() -> None:
         assert str(exc_info.value) == "Test error"
 
 
+async def test_tool_node_error_handling_callable_inferred_once() -> None:
+    def handle_value_error(e: ValueError) -> str:
+        return "Value error"
+
+    tool_node = ToolNode([tool1], handle_tool_errors=handle_value_error)
+    tool_call = {
+        "name": "tool1",
+        "args": {"some_val": 0, "some_other_val": "foo"},
+        "id": "some id",
+    }
+    with patch(
+        "langgraph.prebuilt.tool_node._infer_handled_types",
+        wraps=_infer_handled_types,
+    ) as mock_infer:
+        for _ in range(3):
+            result_error = await tool_node.ainvoke(
+                {"messages": [AIMessage("hi?", tool_calls=[tool_call])]},
+                config=_create_config_with_runtime(),
+            )
+            assert result_error["messages"][-1].content == "Value error"
+
+    # the handled exception types are only inferred from the handler once
+    assert mock_infer.call_count == 1
+
+
 async def test_tool_node_handle_tool_errors_false() -> None:
     with pytest.raises(ValueError) as exc_info:
         ToolNode([tool1], handle_tool_errors=False).invoke(